@@ -13,8 +13,6 @@ References
 """
  
 
-# Import standard packages.
-from __future__ import absolute_import, division, print_function
 # Import local packages.
 from . import main
 from . import utils
@@ -5,8 +5,6 @@
 """
 
 
-# Import standard packages.
-from __future__ import absolute_import, division, print_function
 # Import local packages.
 from . import utils
 
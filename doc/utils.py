@@ -20,18 +20,114 @@ References
 
 
 # Import standard packages.
-from __future__ import absolute_import, division, print_function
+import array
 import ast
+import collections
+import functools
+import os
+import re
+import sys
 import warnings
-# Import installed packages.
-import pandas as pd
-import networkx as nx
-import matplotlib.pyplot as plt
+# Installed packages are imported by the functions that use them
+# to keep `import doc.utils` fast: numpy, networkx, matplotlib, scipy.
+
+
+# Syntax tree nodes that can contain function definitions.
+_BLOCK_TYPES = (ast.stmt, ast.excepthandler) + \
+    ((ast.match_case,) if hasattr(ast, 'match_case') else ())
+# Characters removed from names in 'See Also' fields.
+_STRIP_TBL = str.maketrans('', '', '`\'"{}')
+# Edge relationships. Interned so that all edges share one string per relationship.
+_RELATIONSHIPS = {rel: sys.intern(rel) for rel in ('CALLS', 'CALLED_BY', 'RELATED', 'CONTAINS')}
+# Integer codes for edge relationships returned by `make_graph_csr`.
+RELATIONSHIP_CODES = {'CONTAINS': 0, 'CALLS': 1, 'CALLED_BY': 2, 'RELATED': 3}
+# Fields of 'See Also' section.
+_SEE_ALSO_FIELDS = frozenset(('CALLS', 'CALLED_BY', 'RELATED'))
+# 'See Also' fields. Groups: field name, text between braces.
+_FIELD_RE = re.compile(r'^[ \t]*(CALLS|CALLED_BY|RELATED)[ \t]*:[ \t]*\{([^}\n]*)\}', re.M)
+# 'See Also' section header, underlined by dashes.
+_SEE_ALSO_RE = re.compile(r'^[ \t]*See Also[ \t]*\n[ \t]*-{3,}[ \t]*$', re.M)
+# Docstring section header: title line underlined by dashes.
+_SECTION_RE = re.compile(r'^[ \t]*[^\s-][^\n]*\n[ \t]*-{3,}[ \t]*$', re.M)
+
+
+def _parse_names(body):
+    """Parse names from body of field from 'See Also' section of docstring.
+    
+    Parameters
+    ----------
+    body : string
+        Comma-separated names. Braces, quotes, and backticks are removed.
+        Example 1: ''
+        Example 2: '{func1}'
+        Example 3: 'func1, `func2`'
+    
+    Returns
+    -------
+    names : set
+        Example 1: set()
+        Example 2: {'func1'}
+        Example 3: {'func1', 'func2'}
+    
+    See Also
+    --------
+    CALLS : {}
+    CALLED_BY : {_parse_fields, parse_see_also}
+    RELATED : {}
+    
+    """
+    names = (elt.translate(_STRIP_TBL).strip() for elt in body.split(','))
+    return {name for name in names if name}
+
+
+def _parse_fields(docstring):
+    """Parse relationships from 'See Also' section of docstring.
+    
+    Parameters
+    ----------
+    docstring : string or None
+        Docstring with 'See Also' section with the fields 'CALLS', 'CALLED_BY', 'RELATED'.
+        Fields are lines of the form 'CALLS : {...}'. Only the first line of each field is used.
+        Lines outside of the section are ignored.
+        ``None`` (no docstring) has no fields.
+    
+    Returns
+    -------
+    fields : dict
+        ``dict`` of ``set`` of names, keyed by field.
+        Example: {'CALLS': {'func1', 'func2'}, 'CALLED_BY': set(), 'RELATED': set()}
+    
+    See Also
+    --------
+    CALLS : {_parse_names}
+    CALLED_BY : {make_docs_dict, parse_docstring}
+    RELATED : {}
+    
+    """
+    fields = {}
+    if not docstring:
+        return fields
+    # Scan only the 'See Also' section rather than testing each line for headers.
+    header = _SEE_ALSO_RE.search(docstring)
+    if header is None:
+        return fields
+    pos = header.end()
+    section_end = _SECTION_RE.search(docstring, pos)
+    endpos = len(docstring) if section_end is None else section_end.start()
+    for match in _FIELD_RE.finditer(docstring, pos, endpos):
+        (field, body) = match.groups()
+        if field not in fields:
+            fields[field] = _parse_names(body)
+            if len(fields) == len(_SEE_ALSO_FIELDS):
+                break
+    return fields
 
 
 def parse_see_also(line):
     """Parse field from 'See Also' section of docstring.
     
+    Deprecated. Kept for compatibility. `make_docs_dict` no longer parses fields line by line.
+    
     Parameters
     ----------
     line : string
@@ -42,16 +138,15 @@ def parse_see_also(line):
     Returns
     -------
     field : set
-        {''} returned as empty set instead of {} to allow iteration through the set
-        Example 1: {''}
+        Example 1: set()
         Example 2: {'func1'}
         Example 3: {'func1', 'func2'}
     
     See Also
     --------
-    CALLS : {}
-    CALLED_BY : {parse_docstring}
-    RELATED : {}
+    CALLS : {_parse_names}
+    CALLED_BY : {}
+    RELATED : {parse_docstring}
     
     Notes
     -----
@@ -62,35 +157,38 @@ def parse_see_also(line):
     .. [1] https://github.com/numpy/numpy/blob/master/doc/example.py
     
     """
-    field = line.split(':')[1].strip()
-    field = [elt.strip().replace('`', '').replace('\'', '').replace('"', '') for elt in field.split(',')]
-    field = [elt.replace('{', '').replace('}', '') for elt in field]
-    return set(field)
+    warnings.warn(
+        "`parse_see_also` is deprecated and will be removed.",
+        DeprecationWarning, stacklevel=2)
+    return _parse_names(line.split(':', 1)[1])
 
 
 def parse_docstring(docstring):
     """Parse relationships from docstring.
     
-     Returns a generator that iterates through (field, value) tuples.
+     Deprecated. Use `make_docs_dict`, which parses all fields in one pass.
+     Returns an iterator through (field, value) tuples.
      Docstring must have 'See Also' section with the fields 'CALLS', 'CALLED_BY', 'RELATED'.
+     Fields are lines of the form 'CALLS : {...}'. Only the first line of each field is used.
 
     Parameters
     ----------
-    docstring : string
+    docstring : string or None
         Line separators are '\n'.
+        ``None`` (no docstring) yields no fields.
 
     Returns
     -------
     field : string
         Examples: 'CALLS', 'CALLED_BY', 'RELATED'
     value : set
-        Examples: {''}, {'func1', 'func2'} 
+        Examples: set(), {'func1', 'func2'}
     
     See Also
     --------
-    CALLS : {parse_see_also}
+    CALLS : {_parse_fields}
     CALLED_BY : {}
-    RELATED : {}
+    RELATED : {parse_see_also}
     
     Notes
     -----
@@ -101,30 +199,78 @@ def parse_docstring(docstring):
     .. [1] https://github.com/numpy/numpy/blob/master/doc/example.py
 
     """
-    lines = docstring.split('\n')
-    catch_calls = None
-    catch_called_by = None
-    catch_related = None
-    for line in lines:
-        if 'See Also' in line:
-            catch_calls = True
-            catch_called_by = True
-            catch_related = True
-            continue
-        elif catch_calls and 'CALLS' in line:
-            catch_calls = False
-            yield ('CALLS', parse_see_also(line))
-            continue
-        elif catch_called_by and 'CALLED_BY' in line:
-            catch_called_by = False
-            yield ('CALLED_BY', parse_see_also(line))
-            continue
-        elif catch_related and 'RELATED' in line:
-            catch_related = False
-            yield ('RELATED', parse_see_also(line))
-            continue
-        else:
-            continue
+    warnings.warn(
+        "`parse_docstring` is deprecated. Use `make_docs_dict`.",
+        DeprecationWarning, stacklevel=2)
+    return iter(_parse_fields(docstring).items())
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_file(fpath, mtime, size):
+    """Parse file into an abstract syntax tree.
+    
+    Parameters
+    ----------
+    fpath : string
+        Path to file.
+    mtime : float
+        Modification time of file. Only used as part of the cache key.
+    size : int
+        Size of file in bytes. Only used as part of the cache key.
+    
+    Returns
+    -------
+    tree : ast.Module
+        Cached by (fpath, mtime, size) so that unchanged files are not re-parsed.
+        Treat as read-only.
+    
+    See Also
+    --------
+    CALLS : {}
+    CALLED_BY : {make_docs_dict}
+    RELATED : {}
+    
+    """
+    # Parse bytes directly so that the tokenizer handles the source encoding.
+    with open(fpath, 'rb') as fobj:
+        source = fobj.read()
+    tree = ast.parse(source, filename=fpath)
+    return tree
+
+
+def _walk_functions(tree):
+    """Yield function definitions from abstract syntax tree, breadth first.
+    
+    Parameters
+    ----------
+    tree : ast.AST
+        Output from `_parse_file`.
+    
+    Returns
+    -------
+    node : ast.FunctionDef or ast.AsyncFunctionDef
+        Breadth first, the same order as ``ast.walk``.
+    
+    See Also
+    --------
+    CALLS : {}
+    CALLED_BY : {make_docs_dict}
+    RELATED : {_parse_file}
+    
+    Notes
+    -----
+    Iterative walk over a ``collections.deque`` work queue.
+    Function definitions are statements, so only statements and the clauses that hold them
+    are traversed. Expressions are skipped.
+    
+    """
+    queue = collections.deque([tree])
+    while queue:
+        node = queue.popleft()
+        queue.extend(child for child in ast.iter_child_nodes(node)
+                     if isinstance(child, _BLOCK_TYPES))
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            yield node
 
 
 def make_docs_dict(fpath):
@@ -146,7 +292,7 @@ def make_docs_dict(fpath):
     
     See Also
     --------
-    CALLS : {parse_docstring}
+    CALLS : {_parse_file, _walk_functions, _parse_fields}
     CALLED_BY : {}
     RELATED : {}
     
@@ -160,22 +306,52 @@ def make_docs_dict(fpath):
     
     """
     # TODO: check if CALLS, CALLED_BY, RELATED are existing nodes.
-    with open(fpath, 'rb') as fobj:
-        tree = ast.parse(''.join(fobj))
+    tree = _parse_file(fpath, os.path.getmtime(fpath), os.path.getsize(fpath))
     docs_dict = {'docstring': ast.get_docstring(tree)}
-    for (field, value) in parse_docstring(docs_dict['docstring']):
-        docs_dict[field] = value
-    for node in ast.walk(tree):
-        if isinstance(node, ast.FunctionDef):
-            docs_dict[node.name] = {}
-            docs_dict[node.name]['lineno'] = int(node.lineno)
-            docs_dict[node.name]['col_offset'] = int(node.col_offset)
-            docs_dict[node.name]['docstring'] = ast.get_docstring(node)
-            for (field, value) in parse_docstring(docs_dict[node.name]['docstring']):
-                docs_dict[node.name][field] = value
+    docs_dict.update(_parse_fields(docs_dict['docstring']))
+    for node in _walk_functions(tree):
+        docs_dict[node.name] = {}
+        docs_dict[node.name]['lineno'] = int(node.lineno)
+        docs_dict[node.name]['col_offset'] = int(node.col_offset)
+        docs_dict[node.name]['docstring'] = ast.get_docstring(node)
+        docs_dict[node.name].update(_parse_fields(docs_dict[node.name]['docstring']))
     return docs_dict
 
 
+def _pretty_lines(dobj, indent=0):
+    """Recursively yield formatted lines of dict.
+    
+    Parameters
+    ----------
+    dobj : dict
+    indent : {0}, int, optional
+        Top-level indent.
+    
+    Returns
+    -------
+    line : string
+        Formatted line without line separator.
+    
+    See Also
+    --------
+    CALLS : {_pretty_lines}
+    CALLED_BY : {pretty_print_dict, _pretty_lines}
+    RELATED : {}
+    
+    """
+    prefix = ' '*indent
+    for key in sorted(dobj):
+        if key == 'docstring':
+            yield f"{prefix}{key}: [omitted]"
+        else:
+            value = dobj[key]
+            if isinstance(value, dict):
+                yield f"{prefix}{key}:"
+                yield from _pretty_lines(value, indent=indent+2)
+            else:
+                yield f"{prefix}{key}: {value}"
+
+
 def pretty_print_dict(dobj, indent=0):
     """Recursively print dict with formatting.
     
@@ -191,20 +367,16 @@ def pretty_print_dict(dobj, indent=0):
     
     See Also
     --------
-    CALLS : {}
+    CALLS : {_pretty_lines}
     CALLED_BY : {}
     RELATED : {make_docs_dict}
     
+    Notes
+    -----
+    Output is written to ``sys.stdout`` in a single call.
+    
     """
-    for key in sorted(dobj):
-        if key == 'docstring':
-            print(' '*indent+"{key}: [omitted]".format(key=key))
-        else:
-            if isinstance(dobj[key], dict):
-                print(' '*indent+"{key}:".format(key=key))
-                pretty_print_dict(dobj[key], indent=indent+2)
-            else:
-                print(' '*indent+"{key}: {val}".format(key=key, val=dobj[key]))
+    sys.stdout.write(''.join(line+'\n' for line in _pretty_lines(dobj, indent=indent)))
     return None
 
 
@@ -230,23 +402,23 @@ def generate_edges(dobj, parent=''):
     --------
     CALLS : {generate_edges}
     CALLED_BY : {make_graph}
-    RELATED : {parse_see_also, make_docs_dict, generate_positions}
+    RELATED : {_parse_fields, make_docs_dict, generate_positions}
     
     """
-    for key in sorted(dobj):
+    for (key, value) in dobj.items():
         if key == 'docstring':
             continue
-        elif key in ['CALLS', 'CALLED_BY', 'RELATED']:
+        elif key in _SEE_ALSO_FIELDS:
             node1 = parent
-            node2s = dobj[key]
+            node2s = value
             for node2 in node2s:
-                yield (node1, node2, {'relationship': key})
+                yield (node1, node2, {'relationship': _RELATIONSHIPS[key]})
             continue
-        elif isinstance(dobj[key], dict):
+        elif isinstance(value, dict):
             node1 = parent
             node2 = key
-            yield (node1, node2, {'relationship': 'CONTAINS'})
-            for edge in generate_edges(dobj=dobj[key], parent=key):
+            yield (node1, node2, {'relationship': _RELATIONSHIPS['CONTAINS']})
+            for edge in generate_edges(dobj=value, parent=key):
                 yield edge
             continue
         else:
@@ -272,18 +444,86 @@ def make_graph(dobj, parent=''):
     --------
     CALLS : {generate_edges}
     CALLED_BY : {}
-    RELATED : {make_docs_dict, plot_graph}
+    RELATED : {make_docs_dict, plot_graph, make_graph_csr}
 
     """
+    # Import installed packages.
+    import networkx as nx
     # TODO: make node attributes for lineno and col_offset
     graph = nx.MultiDiGraph()
-    for (node1, node2, attr_dict) in generate_edges(dobj, parent=parent):
-        graph.add_edge(node1, node2, attr_dict=attr_dict)
+    graph.add_edges_from(generate_edges(dobj, parent=parent))
     # Remove empty node references.
-    graph.remove_node('')
+    if '' in graph:
+        graph.remove_node('')
     return graph
 
 
+def make_graph_csr(dobj, parent=''):
+    """Make compact adjacency matrix of graph from ``dict``.
+    
+    Parameters
+    ----------
+    dobj : dict
+        Output from `make_docs_dict`.
+    parent : {''}, string, optional
+        Label for initial parent node.
+        Use '' in place of ``None`` for empty nodes so that nodes are hashable.
+    
+    Returns
+    -------
+    adjacency : scipy.sparse.csr_matrix
+        Shape (num_nodes, num_nodes). Canonical format with ``int32`` number of edges
+        from node1 (row) to node2 (column), summed over parallel edges.
+    labels : list
+        Node labels. Index in list is index in `adjacency`.
+    node1s, node2s : numpy.ndarray
+        Index of node1 and node2 for each edge, in the order yielded by `generate_edges`.
+    relationships : numpy.ndarray
+        ``int8`` code of relationship for each edge, parallel to `node1s` and `node2s`.
+        Codes are values of ``doc.utils.RELATIONSHIP_CODES``:
+        CONTAINS = 0, CALLS = 1, CALLED_BY = 2, RELATED = 3
+    
+    See Also
+    --------
+    CALLS : {generate_edges}
+    CALLED_BY : {}
+    RELATED : {make_graph}
+    
+    Notes
+    -----
+    Alternative to `make_graph` for large graphs. Edges are stored in arrays
+    rather than a ``networkx.MultiDiGraph`` dict of dicts.
+    
+    """
+    # Import installed packages.
+    import numpy as np
+    import scipy.sparse
+    # Map node labels to indices on first sight.
+    indices = {}
+    (node1s, node2s, codes) = (array.array('l'), array.array('l'), array.array('b'))
+    for (node1, node2, attr_dict) in generate_edges(dobj, parent=parent):
+        # Remove empty node references. Keep other node of edge as in `make_graph`.
+        if node1 == '' or node2 == '':
+            for node in (node1, node2):
+                if node != '':
+                    indices.setdefault(node, len(indices))
+            continue
+        node1s.append(indices.setdefault(node1, len(indices)))
+        node2s.append(indices.setdefault(node2, len(indices)))
+        codes.append(RELATIONSHIP_CODES[attr_dict['relationship']])
+    num_nodes = len(indices)
+    node1s = np.frombuffer(node1s, dtype=node1s.typecode)
+    node2s = np.frombuffer(node2s, dtype=node2s.typecode)
+    codes = np.frombuffer(codes, dtype=codes.typecode)
+    # Converting to CSR sums parallel edges.
+    adjacency = scipy.sparse.csr_matrix(
+        (np.ones(node1s.size, dtype=np.int32), (node1s, node2s)),
+        shape=(num_nodes, num_nodes))
+    adjacency.sum_duplicates()
+    labels = list(indices)
+    return (adjacency, labels, node1s, node2s, codes)
+
+
 def generate_positions(dobj, parent=''):
     """Recursively yield line and column number of nodes from ``dict``.
     
@@ -314,23 +554,53 @@ def generate_positions(dobj, parent=''):
     
     """
     # TODO: make node attributes for lineno and col_offset
-    for key in sorted(dobj):
+    for (key, value) in dobj.items():
         if key == 'lineno':
             node = parent
-            yield (node, 'lineno', dobj[key])
+            yield (node, 'lineno', value)
             continue
         elif key == 'col_offset':
             node = parent
-            yield (node, 'col_offset', dobj[key])
+            yield (node, 'col_offset', value)
             continue
-        elif isinstance(dobj[key], dict):
-            for position in generate_positions(dobj=dobj[key], parent=key):
+        elif isinstance(value, dict):
+            for position in generate_positions(dobj=value, parent=key):
                 yield position
                 continue
         else:
             continue
 
 
+def _rankpct_desc(arr):
+    """Rank values as percentiles in descending order.
+    
+    Parameters
+    ----------
+    arr : numpy.ndarray
+        1D array of numbers.
+    
+    Returns
+    -------
+    rankpct : numpy.ndarray
+        1D array of ``float``. Largest value has rank 1/len(arr), smallest has rank 1.
+        Ties are ranked in order of appearance.
+        Equivalent to ``pandas.Series.rank(method='first', ascending=False, pct=True)``.
+    
+    See Also
+    --------
+    CALLS : {}
+    CALLED_BY : {make_positions_dict}
+    RELATED : {}
+    
+    """
+    # Import installed packages.
+    import numpy as np
+    num = arr.size
+    rankpct = np.empty(num, dtype=np.float64)
+    rankpct[np.argsort(-arr, kind='mergesort')] = np.arange(1, num+1) / num
+    return rankpct
+
+
 def make_positions_dict(dobj, graph, parent=''):
     """Make positions from ``dict``.
     
@@ -353,40 +623,43 @@ def make_positions_dict(dobj, graph, parent=''):
     
     See Also
     --------
-    CALLS : {generate_positions}
+    CALLS : {generate_positions, _rankpct_desc}
     CALLED_BY : {}
     RELATED : {make_docs_dict, plot_graph, make_graph}
 
     """
+    # Import installed packages.
+    import numpy as np
     # TODO: make node attributes for lineno and col_offset
     # TODO: space out nodes
-    positions_df = pd.DataFrame(columns=['lineno', 'col_offset'])
-    positions_df.index.names = ['node']
+    # Accumulate positions in a dict.
+    # Format: {node: [lineno, col_offset], ...}
+    positions = {}
     for (node, attr, value) in generate_positions(dobj=dobj, parent=parent):
         if attr == 'lineno':
-            positions_df.loc[node, 'lineno'] = int(value)
+            positions.setdefault(node, [0, 0])[0] = int(value)
             continue
         elif attr == 'col_offset':
-            positions_df.loc[node, 'col_offset'] = int(value)
+            positions.setdefault(node, [0, 0])[1] = int(value)
             continue
         else:
             continue
-    lineno_max = int(positions_df['lineno'].max(axis=0))
-    nodes_only_in_graph = set(graph.nodes()) - set(positions_df.index.values)
+    lineno_max = max(lineno for (lineno, _) in positions.values())
+    nodes_only_in_graph = set(graph.nodes()) - set(positions)
     for node in nodes_only_in_graph:
         lineno_max += 1
-        positions_df.loc[node, 'lineno'] = lineno_max
-        positions_df.loc[node, 'col_offset'] = 0
+        positions[node] = [lineno_max, 0]
+    nodes = list(positions)
+    (linenos, col_offsets) = np.array(list(positions.values()), dtype=np.int64).T
     # Convert line numbers to relative positions. (0, 0) of plot is in lower left.
-    # Convert dtype to use method='first' for rank.
-    positions_df = positions_df.astype(float)
-    positions_df.sort(columns=['lineno', 'col_offset'], axis=0, inplace=True)
-    positions_df[['rankpct_lineno', 'rankpct_col_offset']] = \
-        positions_df[['lineno', 'col_offset']].rank(axis=0, method='first', ascending=False, pct=True)
-    positions_dict = positions_df.stack().unstack(['node']).to_dict()
-    # Convert from dict of dict to dict of list. numpy order: [y, x]
-    positions_dict = {node:[positions_dict[node]['rankpct_col_offset'],
-                            positions_dict[node]['rankpct_lineno']] for node in sorted(positions_dict)}
+    # Sort by lineno, then col_offset. Sort is stable so ties keep insertion order.
+    order = np.lexsort((col_offsets, linenos))
+    rankpct_lineno = _rankpct_desc(linenos[order])
+    rankpct_col_offset = _rankpct_desc(col_offsets[order])
+    # Convert to dict of list. numpy order: [y, x]
+    positions_dict = {node: [float(col_offset), float(lineno)]
+                      for (node, lineno, col_offset)
+                      in zip((nodes[idx] for idx in order), rankpct_lineno, rankpct_col_offset)}
     return positions_dict
 
 
@@ -398,11 +671,11 @@ def plot_graph(graph, fixed=None, positions=None, show_plot=True, fpath=None):
     graph : networkx.MultiDiGraph
         Output from `make_graph`
     fixed : {None}, list, optional
-        Node around which to fix graph. Overrides `positions`.
+        Node around which to fix graph. Nodes are laid out with ``networkx.spring_layout``.
         Example: fixed=['mod1']
     positions : {None}, dict, optional
         ``dict`` of ``list`` output from `make_positions_dict`.
-        Requires `fixed` is ``None``, otherwise overridden. 
+        If `fixed` is ``None``, used as is. Otherwise used as initial positions for the layout.
     show_plot : {True, False}, bool, optional
         Flag to display plot in window.
     fpath : {None}, string, optional
@@ -419,6 +692,9 @@ def plot_graph(graph, fixed=None, positions=None, show_plot=True, fpath=None):
     RELATED : {make_positions_dict, make_graph}
 
     """
+    # Import installed packages.
+    import matplotlib.pyplot as plt
+    import networkx as nx
     # TODO: Space out points. Scale to larger image?
     # TODO: make relationships different colors
     # Check input and define positions.
@@ -428,13 +704,11 @@ def plot_graph(graph, fixed=None, positions=None, show_plot=True, fpath=None):
         else:
             pos = positions
     else:
-        if positions is not None:
-            warnings.warn(
-                ("\n" +
-                 "`fixed` overrides `positions`:\n" +
-                 "fixed = {fixed}").format(
-                     fixed=fixed))
-        pos = nx.spring_layout(graph, fixed=fixed)
+        if positions is None:
+            pos = nx.spring_layout(graph, fixed=fixed)
+        else:
+            # Initial positions skip random initialization and need fewer iterations to converge.
+            pos = nx.spring_layout(graph, pos=positions, fixed=fixed, iterations=20)
     # Draw graph and save.
     nx.draw(graph, pos=pos)
     nx.draw_networkx_labels(graph, pos=pos)
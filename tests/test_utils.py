@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for doc/utils.py.
+
+"""
+
+
+# Import standard packages.
+import os
+# Import installed packages.
+import pytest
+# Import local packages.
+from doc import utils
+
+
+FPATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'doc', 'utils.py')
+
+
+def test_make_positions_dict():
+    """Parse file, make graph, then make positions for every node of graph."""
+    pytest.importorskip('networkx')
+    docs_dict = utils.make_docs_dict(FPATH)
+    graph = utils.make_graph(docs_dict)
+    positions = utils.make_positions_dict(docs_dict, graph)
+    assert set(positions) == set(graph.nodes())
+    for (col_offset, lineno) in positions.values():
+        assert 0 < col_offset <= 1
+        assert 0 < lineno <= 1
+    # First function in file is at top of plot.
+    first = min((value['lineno'], key) for (key, value) in docs_dict.items() if isinstance(value, dict))[1]
+    assert positions[first][1] == 1
+
+
+def test_parse_docstring_see_also_header():
+    """Only fields after the 'See Also' header are parsed."""
+    docstring = (
+        "Summary.\n\n"
+        "CALLS : {before}\n\n"
+        "See Also\n"
+        "--------\n"
+        "CALLS : {`func1`, func2}\n"
+        "CALLED_BY : {}\n")
+    with pytest.deprecated_call():
+        fields = dict(utils.parse_docstring(docstring))
+    assert fields == {'CALLS': {'func1', 'func2'}, 'CALLED_BY': set()}
+    with pytest.deprecated_call():
+        assert dict(utils.parse_docstring("CALLS : {before}\n")) == {}
+
+
+def test_parse_docstring_see_also_section_end():
+    """Fields in sections after 'See Also' are not parsed."""
+    docstring = (
+        "See Also\n"
+        "--------\n"
+        "CALLS : {func1}\n\n"
+        "Notes\n"
+        "-----\n"
+        "RELATED : {after}\n")
+    with pytest.deprecated_call():
+        assert dict(utils.parse_docstring(docstring)) == {'CALLS': {'func1'}}
+
+
+def test_make_graph_csr():
+    """Edges of compact graph are the same as edges of `make_graph`."""
+    pytest.importorskip('networkx')
+    pytest.importorskip('scipy')
+    docs_dict = utils.make_docs_dict(FPATH)
+    graph = utils.make_graph(docs_dict)
+    (adjacency, labels, node1s, node2s, relationships) = utils.make_graph_csr(docs_dict)
+    rels = {code: rel for (rel, code) in utils.RELATIONSHIP_CODES.items()}
+    edges = sorted(
+        (labels[node1], labels[node2], rels[code])
+        for (node1, node2, code) in zip(node1s, node2s, relationships))
+    assert edges == sorted(
+        (node1, node2, attr_dict['relationship'])
+        for (node1, node2, attr_dict) in graph.edges(data=True))
+    assert adjacency.has_canonical_format
+    assert adjacency.sum() == graph.number_of_edges()
+
+
+def test_parse_see_also():
+    """Empty fields parse to empty sets. Braces, quotes, and spaces are removed."""
+    with pytest.deprecated_call():
+        assert utils.parse_see_also('    CALLS : {}') == set()
+    with pytest.deprecated_call():
+        assert utils.parse_see_also('    CALLED_BY : { func1 }') == {'func1'}
+    with pytest.deprecated_call():
+        assert utils.parse_see_also("    RELATED : {`func1`, 'func2', func1}") == {'func1', 'func2'}
+
+
+def test_make_graph_parent():
+    """Graph with non-empty parent has no empty node."""
+    pytest.importorskip('networkx')
+    docs_dict = utils.make_docs_dict(FPATH)
+    graph = utils.make_graph(docs_dict, parent='mod')
+    assert '' not in graph
+    assert graph.has_edge('mod', 'make_graph')